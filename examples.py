@@ -4,48 +4,114 @@ Example usage of the Podcast Creator Agent
 """
 
 import os
-from main import PodcastAgent
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from main import PodcastAgent, configure_logging
 from loguru import logger
 
+# Resolved once at import; main.py has already loaded .env by this point
+API_KEY = os.environ.get("GOOGLE_AI_API_KEY")
+
+SEP_50 = "=" * 50
+SEP_60 = "=" * 60
+
+_BANNER = f"""🚀 Podcast Creator Agent Examples
+{SEP_60}
+This will demonstrate various ways to use the PodcastAgent.
+Note: Video generation can take several minutes per episode (3 videos per episode).
+
+"""
+
+_MISSING_KEY_MESSAGE = """❌ Error: GOOGLE_AI_API_KEY environment variable not set!
+Please set your Google AI API key before running examples.
+Example: export GOOGLE_AI_API_KEY='your_api_key_here'
+"""
+
+_PART_NAMES = ("Introduction", "Main Content", "Conclusion")
+
+
+@lru_cache(maxsize=1)
+def _get_agent() -> PodcastAgent:
+    """Return a shared PodcastAgent so all examples reuse one client."""
+    return PodcastAgent(api_key=API_KEY)
+
+
+@lru_cache(maxsize=1)
+def _default_image():
+    """Generate the default studio image once; it does not depend on the topic."""
+    return _get_agent().generate_podcast_image()
+
+
+def warm_up():
+    """Build the shared agent and open its API connection before the examples run."""
+    agent = _get_agent()
+    try:
+        # Cheap metadata call; only the first page is fetched
+        agent.client.models.list(config={"page_size": 1})
+    except Exception as e:
+        logger.warning(f"Warm-up request failed: {e}")
+
+
+def _preview(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _format_script_preview(script_parts: list[str]) -> str:
+    """Build the per-part script preview as a single string."""
+    return "\n".join(
+        f"\nPart {i} ({name}):\n{_preview(part, 150)}"
+        for i, (name, part) in enumerate(zip(_PART_NAMES, script_parts), 1)
+    )
+
+
+def _format_episode_summary(topic: str, result: dict) -> str:
+    """Build the created-episode summary as a single string."""
+    return (
+        f"✅ Created podcast episode about: {topic}\n"
+        f"📁 Files saved in: output/\n"
+        f"🖼️ Image: {result['image_path']}\n"
+        f"📝 Script: {result['script_path']}\n"
+        f"🎬 Video: {result['video_path']}"
+    )
+
 
 def example_basic_usage():
     """Basic example: Create a complete podcast episode."""
     print("🎙️ Example 1: Basic Usage")
-    print("=" * 50)
+    print(SEP_50)
 
-    agent = PodcastAgent()
+    agent = _get_agent()
 
     topic = "The Future of Renewable Energy"
-    result = agent.create_podcast_episode(topic)
-
-    print(f"✅ Created podcast episode about: {topic}")
-    print(f"📁 Files saved in: output/")
-    print(f"🖼️ Image: {result['image_path']}")
-    print(f"📝 Script: {result['script_path']}")
-    print(f"🎬 Video: {result['video_path']}")
-    print(f"\n📋 Generated Script (3 parts, complete podcast segments):")
-    for i, part in enumerate(result["script_parts"], 1):
-        part_names = ["Introduction", "Main Content", "Conclusion"]
-        print(f"\nPart {i} ({part_names[i-1]}):\n{part[:150]}...")
+    image, image_bytes = _default_image()
+    result = agent.create_podcast_episode(topic, image=image, image_bytes=image_bytes)
+
+    print(_format_episode_summary(topic, result))
+    print(
+        "\n📋 Generated Script (3 parts, complete podcast segments):\n"
+        + _format_script_preview(result["script_parts"])
+    )
     print("\n")
 
 
 def example_with_search_grounding():
     """Example: Create a podcast episode with Google Search grounding for factual data."""
     print("🔍 Example 2: With Google Search Grounding")
-    print("=" * 50)
+    print(SEP_50)
 
-    agent = PodcastAgent()
+    agent = _get_agent()
 
     # Use a topic that benefits from current information
     topic = "Latest developments in AI and machine learning 2024"
-    result = agent.create_podcast_episode(topic, use_search=True)
+    image, image_bytes = _default_image()
+    result = agent.create_podcast_episode(
+        topic, use_search=True, image=image, image_bytes=image_bytes
+    )
 
-    print(f"✅ Created podcast episode about: {topic}")
-    print(f"📁 Files saved in: output/")
-    print(f"🖼️ Image: {result['image_path']}")
-    print(f"📝 Script: {result['script_path']}")
-    print(f"🎬 Video: {result['video_path']}")
+    print(_format_episode_summary(topic, result))
 
     # Display grounding metadata
     grounding_metadata = result.get("grounding_metadata", {})
@@ -65,21 +131,19 @@ def example_with_search_grounding():
                     title = getattr(web_info, "title", "Unknown Title")
                     print(f"  {i}. {title}")
 
-    print(f"\n📋 Generated Script (3 parts, complete podcast segments):")
-    for i, part in enumerate(result["script_parts"], 1):
-        part_names = ["Introduction", "Main Content", "Conclusion"]
-        print(f"\nPart {i} ({part_names[i-1]}):\n{part[:150]}...")
+    print(
+        "\n📋 Generated Script (3 parts, complete podcast segments):\n"
+        + _format_script_preview(result["script_parts"])
+    )
 
     # Show script with citations
     if grounding_metadata.get("grounding_supports"):
         print(f"\n📄 Script with Citations:")
-        combined_script = "\n\n---PART---\n\n".join(result["script_parts"])
-        script_with_citations = agent.add_citations(combined_script, grounding_metadata)
-        print(
-            script_with_citations[:300] + "..."
-            if len(script_with_citations) > 300
-            else script_with_citations
+        # Citation offsets refer to the raw response, not the cleaned script parts
+        script_with_citations = agent.add_citations(
+            grounding_metadata["response_text"], grounding_metadata
         )
+        print(_preview(script_with_citations, 300))
 
     print("\n")
 
@@ -87,9 +151,9 @@ def example_with_search_grounding():
 def example_custom_image_prompt():
     """Example with custom image prompt."""
     print("🎙️ Example 2: Custom Image Prompt")
-    print("=" * 50)
+    print(SEP_50)
 
-    agent = PodcastAgent()
+    agent = _get_agent()
 
     topic = "Space Exploration"
     custom_prompt = (
@@ -102,44 +166,67 @@ def example_custom_image_prompt():
         topic=topic, custom_image_prompt=custom_prompt, output_dir="output/space_themed"
     )
 
-    print(f"✅ Created space-themed podcast about: {topic}")
-    print(f"📁 Files saved in: output/space_themed/")
-    print(f"🖼️ Custom image generated with space theme")
-    print(f"🎬 24-second video created from 3 parts")
-    print("\n")
+    print(
+        f"✅ Created space-themed podcast about: {topic}\n"
+        f"📁 Files saved in: output/space_themed/\n"
+        f"🖼️ Custom image generated with space theme\n"
+        f"🎬 24-second video created from 3 parts\n\n"
+    )
 
 
 def example_individual_components():
     """Example using individual components separately."""
     print("🎙️ Example 3: Individual Components")
-    print("=" * 50)
+    print(SEP_50)
+
+    agent = _get_agent()
 
-    agent = PodcastAgent()
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
 
     # Generate just an image
     print("🖼️ Generating podcast image...")
-    image = agent.generate_podcast_image()
-    image.save("output/standalone_image.png")
-    print("✅ Image saved to: output/standalone_image.png")
+    image, image_bytes = _default_image()
 
     # Generate just a script (3 parts)
     print("📝 Generating 3-part podcast script...")
     topic = "Digital Privacy in 2024"
-    script_parts = agent.generate_podcast_script(topic)
-    for i, script_part in enumerate(script_parts, 1):
-        with open(f"output/standalone_script_part_{i}.txt", "w", encoding="utf-8") as f:
-            f.write(script_part)
-    print("✅ Script parts saved to: output/standalone_script_part_*.txt")
-    for i, part in enumerate(script_parts, 1):
-        print(f"📋 Script part {i} preview: {part[:100]}...")
-
-    # Generate just a video (using the image and first script part)
-    print("🎬 Generating single video segment...")
-    video_path = agent.generate_podcast_video(
-        script=script_parts[0],
-        image=image,
-        output_filename="output/standalone_video.mp4",
-    )
+    script_parts, _ = agent.generate_podcast_script(topic)
+
+    with ThreadPoolExecutor(max_workers=len(script_parts) + 2) as executor:
+        # Start the long-running video job first so the local writes overlap it
+        print("🎬 Generating single video segment...")
+        video_future = executor.submit(
+            agent.generate_podcast_video,
+            script=script_parts[0],
+            image=image,
+            output_filename="output/standalone_video.mp4",
+        )
+
+        # Persist the image and script parts concurrently
+        writes = [
+            executor.submit(
+                (output_dir / "standalone_image.png").write_bytes, image_bytes
+            )
+        ]
+        writes += [
+            executor.submit(
+                (output_dir / f"standalone_script_part_{i}.txt").write_text,
+                script_part,
+                encoding="utf-8",
+            )
+            for i, script_part in enumerate(script_parts, 1)
+        ]
+        for write in writes:
+            write.result()
+        print(
+            "✅ Image saved to: output/standalone_image.png\n"
+            "✅ Script parts saved to: output/standalone_script_part_*.txt"
+        )
+        for i, part in enumerate(script_parts, 1):
+            print(f"📋 Script part {i} preview: {_preview(part, 100)}")
+
+        video_path = video_future.result()
     print(f"✅ Video saved to: {video_path}")
     print("\n")
 
@@ -147,25 +234,37 @@ def example_individual_components():
 def example_batch_creation():
     """Example: Create multiple podcast episodes on different topics."""
     print("🎙️ Example 4: Batch Creation")
-    print("=" * 50)
+    print(SEP_50)
 
-    agent = PodcastAgent()
+    agent = _get_agent()
 
     topics = ["Cryptocurrency Trends", "Remote Work Revolution", "Sustainable Fashion"]
 
-    results = []
-    for i, topic in enumerate(topics, 1):
-        print(f"🔄 Creating episode {i}/{len(topics)}: {topic}")
+    image, image_bytes = _default_image()
 
-        try:
-            result = agent.create_podcast_episode(
-                topic=topic, output_dir=f"output/batch_episode_{i}"
+    results = []
+    # Episodes are dominated by remote API latency, so run them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(topics), 4)) as executor:
+        futures = {}
+        for i, topic in enumerate(topics, 1):
+            print(f"🔄 Creating episode {i}/{len(topics)}: {topic}")
+            future = executor.submit(
+                agent.create_podcast_episode,
+                topic=topic,
+                output_dir=f"output/batch_episode_{i}",
+                image=image,
+                image_bytes=image_bytes,
             )
-            results.append(result)
-            print(f"✅ Episode {i} completed!")
+            futures[future] = i
+
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results.append(future.result())
+                print(f"✅ Episode {i} completed!")
 
-        except Exception as e:
-            print(f"❌ Episode {i} failed: {e}")
+            except Exception as e:
+                print(f"❌ Episode {i} failed: {e}")
 
     print(f"\n🎉 Batch creation completed! Created {len(results)} episodes.")
     print("\n")
@@ -173,20 +272,17 @@ def example_batch_creation():
 
 def main():
     """Run all examples."""
+    configure_logging()
     try:
         # Check if API key is set
-        if not os.getenv("GOOGLE_AI_API_KEY"):
-            print("❌ Error: GOOGLE_AI_API_KEY environment variable not set!")
-            print("Please set your Google AI API key before running examples.")
-            print("Example: export GOOGLE_AI_API_KEY='your_api_key_here'")
+        if not API_KEY:
+            sys.stdout.write(_MISSING_KEY_MESSAGE)
             return
 
-        print("🚀 Podcast Creator Agent Examples")
-        print("=" * 60)
-        print("This will demonstrate various ways to use the PodcastAgent.")
-        print(
-            "Note: Video generation can take several minutes per episode (3 videos per episode).\n"
-        )
+        sys.stdout.write(_BANNER)
+        sys.stdout.flush()
+
+        warm_up()
 
         # Create output directory
         os.makedirs("output", exist_ok=True)
@@ -206,7 +302,7 @@ def main():
     except KeyboardInterrupt:
         print("\n⏹️ Examples interrupted by user.")
     except Exception as e:
-        logger.error(f"Examples failed: {e}")
+        logger.exception("Examples failed")
         print(f"❌ Error running examples: {e}")
 
 
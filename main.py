@@ -1,13 +1,26 @@
+import asyncio
+import hashlib
+import json
+import math
 import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
 import time
-import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Literal, Optional, Union
 from io import BytesIO
 
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from PIL import Image
 from dotenv import load_dotenv
 from loguru import logger
@@ -15,6 +28,162 @@ from loguru import logger
 # Load environment variables
 load_dotenv()
 
+# Separator Gemini is asked to place between script parts
+_PART_SEP = "---PART---"
+_WS_RE = re.compile(r"\s+")
+_MD_RE = re.compile(r"\*+")
+
+_SCRIPT_PROMPT_TMPL = (
+    "Write a complete podcast script about '{topic}' with exactly 3 parts, each designed for 8-second video segments. "
+    "Hosts are Alex (male) and Sarah (female). Create a full podcast experience with proper introduction, main content, and conclusion. "
+    "Each part should be conversational and engaging, with natural host interactions and smooth transitions. "
+    "Format: 'Alex: [dialogue] Sarah: [response]' for each part. "
+    "Separate parts with '---PART---'. "
+    "Include current, factual information when relevant. "
+    "Make each part feel like a complete segment of a real podcast episode. "
+    "Example structure:\n"
+    "Part 1 (Introduction): Welcome, topic introduction, what listeners will learn\n"
+    "Alex: Welcome to TechTalk! I'm Alex, and I'm here with Sarah.\n"
+    "Sarah: Hey everyone! Today we're diving deep into {topic}.\n"
+    "Alex: This is going to be fascinating because it affects all of us.\n"
+    "Sarah: Absolutely! Let's break down what you need to know.\n"
+    "---PART---\n"
+    "Part 2 (Main Content): Key insights, facts, and detailed discussion\n"
+    "Alex: So here's what's really interesting about this topic...\n"
+    "Sarah: That's a great point, and I think what's even more important is...\n"
+    "Alex: Exactly! And when you consider the implications...\n"
+    "Sarah: Right, which brings us to the next crucial aspect...\n"
+    "---PART---\n"
+    "Part 3 (Conclusion): Key takeaways, wrap-up, and call-to-action\n"
+    "Alex: So to summarize what we've learned today...\n"
+    "Sarah: Those are some really important points to remember.\n"
+    "Alex: Thanks for listening! What are your thoughts on this topic?\n"
+    "Sarah: We'd love to hear from you! Until next time, keep learning!"
+)
+
+# Grounding metadata fields surfaced to callers
+_GROUNDING_FIELDS = ("web_search_queries", "grounding_chunks", "grounding_supports")
+
+# Terminal states of a Gemini batch job
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+def _extract_grounding_metadata(response: types.GenerateContentResponse) -> dict:
+    """Return the search grounding fields of a Gemini response, or {} if it has none.
+
+    The raw response text is included as "response_text", since the segment offsets in
+    grounding_supports refer to it rather than to the cleaned-up script parts.
+    """
+    try:
+        metadata = response.candidates[0].grounding_metadata
+    except (AttributeError, IndexError, TypeError):
+        return {}
+    if not metadata:
+        return {}
+    grounding = {
+        field: getattr(metadata, field, None) or [] for field in _GROUNDING_FIELDS
+    }
+    grounding["response_text"] = getattr(response, "text", None) or ""
+    return grounding
+
+
+def configure_logging():
+    """Replace loguru's default sink with a queued stderr sink at LOG_LEVEL.
+
+    Called by the entry points, not on import, so host applications keep their own sinks.
+    The queue hands records to a background thread so sink writes never block API polling.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=os.getenv("LOG_LEVEL", "INFO"), enqueue=True)
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_exe() -> Optional[str]:
+    """Locate an ffmpeg binary, falling back to the one bundled with imageio-ffmpeg."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return None
+
+
+def _new_client(api_key: str) -> genai.Client:
+    """Create a Google AI client whose HTTP pool can keep every parallel request alive."""
+    pool_size = int(os.getenv("HTTP_POOL_SIZE", "32"))
+    limits = httpx.Limits(
+        max_connections=pool_size, max_keepalive_connections=pool_size
+    )
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"limits": limits}, async_client_args={"limits": limits}
+        ),
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> genai.Client:
+    """Return a Google AI client shared by every agent using the same API key."""
+    return _new_client(api_key)
+
+
+def _retry_after_seconds(error: errors.APIError) -> Optional[float]:
+    """Return the Retry-After delay from an API error response, if present."""
+    headers = getattr(error.response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_retry(
+    fn,
+    *args,
+    max_attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 30.0,
+    idempotent: bool = True,
+    **kwargs,
+):
+    """Call fn, retrying rate-limit and server errors with jittered exponential backoff.
+
+    Pass idempotent=False for paid job submissions: a server error or timeout may
+    arrive after the job was created, so only rate-limit (429) rejections are retried.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except errors.APIError as e:
+            if idempotent:
+                retryable = isinstance(e, errors.ServerError) or e.code in (408, 429)
+            else:
+                retryable = e.code == 429
+            if not retryable or attempt == max_attempts - 1:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = min(cap, base * 2**attempt) + random.uniform(0, 0.5)
+            else:
+                delay = min(cap, delay)
+            logger.warning(
+                f"Transient API error ({e.code}), retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{max_attempts})"
+            )
+            time.sleep(delay)
+
+
+class VideoGenerationError(Exception):
+    """A Veo operation finished remotely without producing a video."""
+
 
 class PodcastAgent:
     """AI-powered podcast creator using Google's Imagen, Gemini, and Veo models."""
@@ -55,12 +224,46 @@ class PodcastAgent:
             self.veo_model = st.secrets.get(
                 "VEO_MODEL", os.getenv("VEO_MODEL", "veo-3.0-generate-001")
             )
+            self.veo_model_fast = st.secrets.get(
+                "VEO_MODEL_FAST",
+                os.getenv("VEO_MODEL_FAST", "veo-3.0-fast-generate-001"),
+            )
         except:
             self.imagen_model = os.getenv("IMAGEN_MODEL", "imagen-4.0-generate-001")
             self.gemini_model = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
             self.veo_model = os.getenv("VEO_MODEL", "veo-3.0-generate-001")
+            self.veo_model_fast = os.getenv(
+                "VEO_MODEL_FAST", "veo-3.0-fast-generate-001"
+            )
 
-        self.client = genai.Client(api_key=self.api_key)
+        # Local result caches for repeat prompts; PODCAST_CACHE_DISABLE=1 turns them off
+        self.cache_enabled = os.getenv("PODCAST_CACHE_DISABLE") != "1"
+        self.image_cache_dir = Path(os.getenv("IMAGE_CACHE_DIR", ".cache/imagen"))
+        self.image_cache_max_entries = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "100"))
+        self.script_cache_dir = Path(os.getenv("SCRIPT_CACHE_DIR", ".cache/gemini"))
+        self.script_cache_max_entries = int(
+            os.getenv("SCRIPT_CACHE_MAX_ENTRIES", "500")
+        )
+        # Cosine similarity above which a cached script is reused for a paraphrased
+        # topic; 0 (the default) disables the extra embedding call
+        self.script_cache_similarity = float(os.getenv("SCRIPT_CACHE_SIMILARITY", "0"))
+        self.embedding_model = os.getenv("EMBEDDING_MODEL", "gemini-embedding-001")
+        # (unit topic embedding, cache path) pairs for scripts generated by this process
+        self._topic_embeddings = deque(maxlen=self.script_cache_max_entries)
+
+        # Veo polling schedule (seconds): start short, back off up to the cap
+        self.veo_poll_initial = float(os.getenv("VEO_POLL_INITIAL", "2.0"))
+        self.veo_poll_max = float(os.getenv("VEO_POLL_MAX", "30.0"))
+        # Unset means wait as long as Veo takes; renders can run well past 10 minutes
+        poll_timeout = os.getenv("VEO_POLL_TIMEOUT")
+        self.veo_poll_timeout = float(poll_timeout) if poll_timeout else None
+        # Upper bound on episodes whose Veo jobs run at the same time
+        self.veo_max_concurrency = int(os.getenv("VEO_MAX_CONCURRENCY", "4"))
+
+        # Background pool for local file writes that should not block API calls
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
+        self.client = _get_client(self.api_key)
         logger.info(
             f"PodcastAgent initialized successfully with models: Imagen={self.imagen_model}, Gemini={self.gemini_model}, Veo={self.veo_model}"
         )
@@ -74,25 +277,61 @@ class PodcastAgent:
         except Exception as e:
             logger.warning(f"Client connection issue detected: {e}")
             logger.info("Reinitializing Google AI client...")
-            self.client = genai.Client(api_key=self.api_key)
+            self.client = _new_client(self.api_key)
             return True
 
     def refresh_client(self):
         """Refresh the Google AI client connection."""
         logger.info("Refreshing Google AI client connection...")
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = _new_client(self.api_key)
         logger.info("Client refreshed successfully")
 
+    def _cache_path(self, cache_dir: Path, model: str, key: str, suffix: str) -> Path:
+        """Return the cache file path for a model/key pair."""
+        digest = hashlib.sha256(f"{model}|{key}".encode("utf-8")).hexdigest()
+        return cache_dir / f"{digest}{suffix}"
+
+    def _write_cache(self, cache_path: Path, data: bytes):
+        """Atomically write data to a cache file, logging instead of raising on failure."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {cache_path}: {e}")
+
+    def _write_image_cache(self, cache_path: Path, image_bytes: bytes):
+        """Store an image in the cache as lossless WebP, which is much smaller than PNG."""
+        webp_bytes = BytesIO()
+        Image.open(BytesIO(image_bytes)).save(webp_bytes, format="WEBP", lossless=True)
+        self._write_cache(cache_path, webp_bytes.getvalue())
+        self._evict_cache(cache_path.parent, self.image_cache_max_entries)
+
+    def _evict_cache(self, cache_dir: Path, max_entries: int):
+        """Delete the least recently used cache files beyond max_entries, by mtime."""
+        try:
+            entries = sorted(
+                (entry for entry in os.scandir(cache_dir) if entry.is_file()),
+                key=lambda entry: entry.stat().st_mtime,
+                reverse=True,
+            )
+            for entry in entries[max_entries:]:
+                os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Could not evict cache entries in {cache_dir}: {e}")
+
     def generate_podcast_image(
-        self, custom_prompt: Optional[str] = None
-    ) -> Image.Image:
+        self, custom_prompt: Optional[str] = None, ignore_cache: bool = False
+    ) -> tuple[Image.Image, bytes]:
         """Generate a podcast image using Imagen.
 
         Args:
             custom_prompt: Custom prompt for image generation. If not provided, uses default.
+            ignore_cache: Always call Imagen, replacing any cached image for the prompt.
 
         Returns:
-            PIL Image object of the generated podcast photo.
+            Tuple of (PIL Image of the generated podcast photo, PNG bytes as returned by Imagen).
         """
         prompt = custom_prompt or (
             "Two professional podcast hosts: Alex (male, 30s, friendly smile) and Sarah (female, 30s, warm expression) "
@@ -103,8 +342,28 @@ class PodcastAgent:
 
         logger.info(f"Generating podcast image with prompt: {prompt}")
 
+        cache_path = self._cache_path(
+            self.image_cache_dir, self.imagen_model, prompt, ".webp"
+        )
+        if self.cache_enabled and not ignore_cache and cache_path.exists():
+            try:
+                # Cached copies are WebP; callers and Veo expect PNG bytes
+                image = Image.open(cache_path)
+                image.load()
+                # Mark the entry as recently used for eviction
+                os.utime(cache_path)
+                png_bytes = BytesIO()
+                # Fast zlib level: the bytes are short-lived and the WebP copy is the one kept
+                image.save(png_bytes, format="PNG", compress_level=1)
+                logger.success(f"Podcast image loaded from cache: {cache_path}")
+                return image, png_bytes.getvalue()
+            except (OSError, ValueError) as e:
+                # Evicted by another session, unreadable or corrupt: regenerate it
+                logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+
         try:
-            response = self.client.models.generate_images(
+            response = _with_retry(
+                self.client.models.generate_images,
                 model=self.imagen_model,
                 prompt=prompt,
                 config=types.GenerateImagesConfig(
@@ -114,15 +373,96 @@ class PodcastAgent:
             )
 
             generated_image = response.generated_images[0]
-            image = Image.open(BytesIO(generated_image.image.image_bytes))
+            image_bytes = generated_image.image.image_bytes
+            image = Image.open(BytesIO(image_bytes))
+            # Decode eagerly so the image can be shared safely across threads
+            image.load()
+
+            if self.cache_enabled:
+                self._io_pool.submit(self._write_image_cache, cache_path, image_bytes)
 
             logger.success("Podcast image generated successfully")
-            return image
+            return image, image_bytes
 
         except Exception as e:
             logger.error(f"Failed to generate podcast image: {e}")
             raise
 
+    def _read_script_cache(self, cache_path: Path) -> Optional[list[str]]:
+        """Load cached script parts and mark them recently used, or None if unusable."""
+        try:
+            parts = json.loads(cache_path.read_text(encoding="utf-8"))
+            if not isinstance(parts, list) or len(parts) != 3:
+                raise ValueError("expected a list of 3 script parts")
+            # Touch the entry so eviction treats it as recently used
+            os.utime(cache_path)
+            return parts
+        except (OSError, ValueError) as e:
+            # Evicted by another session, unreadable or corrupt: regenerate it
+            logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+            return None
+
+    def _embed_topic(self, topic: str) -> list[float]:
+        """Return the unit-length embedding of a topic for similarity lookups."""
+        response = _with_retry(
+            self.client.models.embed_content,
+            model=self.embedding_model,
+            contents=topic,
+            config=types.EmbedContentConfig(
+                task_type="SEMANTIC_SIMILARITY", output_dimensionality=768
+            ),
+        )
+        values = response.embeddings[0].values
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+    def _find_similar_script(self, embedding: list[float]) -> Optional[Path]:
+        """Return the cached script whose topic is closest to embedding, if close enough."""
+        best_path, best_score = None, self.script_cache_similarity
+        for other, path in list(self._topic_embeddings):
+            # Both vectors are unit length, so the dot product is the cosine similarity
+            score = sum(a * b for a, b in zip(embedding, other))
+            if score >= best_score:
+                best_path, best_score = path, score
+        if best_path is not None and best_path.exists():
+            return best_path
+        return None
+
+    def _build_script_prompt(self, topic: str) -> str:
+        """Build the Gemini prompt for a 3-part podcast script about topic."""
+        return _SCRIPT_PROMPT_TMPL.format(topic=topic)
+
+    def _split_script_parts(self, full_script: str) -> list[str]:
+        """Split a generated script into exactly 3 cleaned parts."""
+        # Split on every separator and drop empty pieces, so leading or trailing
+        # separators don't produce blank parts; extras are merged into the last part
+        parts = [part for part in full_script.split(_PART_SEP) if part.strip()]
+        if len(parts) > 3:
+            parts = [parts[0], parts[1], " ".join(parts[2:])]
+        elif len(parts) < 3:
+            # Fallback: try to split by double newlines or other separators
+            parts = [part.strip() for part in full_script.split("\n\n") if part.strip()]
+            if len(parts) < 3:
+                # If still not 3 parts, create equal divisions
+                words = full_script.split()
+                words_per_part = len(words) // 3
+                parts = [
+                    " ".join(words[:words_per_part]),
+                    " ".join(words[words_per_part : words_per_part * 2]),
+                    " ".join(words[words_per_part * 2 :]),
+                ]
+            elif len(parts) > 3:
+                # If more than 3 parts, combine the extras
+                parts = [parts[0], parts[1], " ".join(parts[2:])]
+
+        # Clean up each part - remove markdown emphasis like **text** and *text*,
+        # then collapse whitespace and newlines
+        cleaned_parts = [
+            _WS_RE.sub(" ", _MD_RE.sub("", part)).strip() for part in parts
+        ]
+
+        return cleaned_parts
+
     def generate_podcast_script(
         self, topic: str, use_search: bool = False
     ) -> tuple[list[str], dict]:
@@ -135,33 +475,7 @@ class PodcastAgent:
         Returns:
             Tuple of (List of 3 script parts, grounding metadata dict).
         """
-        prompt = (
-            f"Write a complete podcast script about '{topic}' with exactly 3 parts, each designed for 8-second video segments. "
-            f"Hosts are Alex (male) and Sarah (female). Create a full podcast experience with proper introduction, main content, and conclusion. "
-            f"Each part should be conversational and engaging, with natural host interactions and smooth transitions. "
-            f"Format: 'Alex: [dialogue] Sarah: [response]' for each part. "
-            f"Separate parts with '---PART---'. "
-            f"Include current, factual information when relevant. "
-            f"Make each part feel like a complete segment of a real podcast episode. "
-            f"Example structure:\n"
-            f"Part 1 (Introduction): Welcome, topic introduction, what listeners will learn\n"
-            f"Alex: Welcome to TechTalk! I'm Alex, and I'm here with Sarah.\n"
-            f"Sarah: Hey everyone! Today we're diving deep into {topic}.\n"
-            f"Alex: This is going to be fascinating because it affects all of us.\n"
-            f"Sarah: Absolutely! Let's break down what you need to know.\n"
-            f"---PART---\n"
-            f"Part 2 (Main Content): Key insights, facts, and detailed discussion\n"
-            f"Alex: So here's what's really interesting about this topic...\n"
-            f"Sarah: That's a great point, and I think what's even more important is...\n"
-            f"Alex: Exactly! And when you consider the implications...\n"
-            f"Sarah: Right, which brings us to the next crucial aspect...\n"
-            f"---PART---\n"
-            f"Part 3 (Conclusion): Key takeaways, wrap-up, and call-to-action\n"
-            f"Alex: So to summarize what we've learned today...\n"
-            f"Sarah: Those are some really important points to remember.\n"
-            f"Alex: Thanks for listening! What are your thoughts on this topic?\n"
-            f"Sarah: We'd love to hear from you! Until next time, keep learning!"
-        )
+        prompt = self._build_script_prompt(topic)
 
         logger.info(
             f"Generating 3-part podcast script for topic: {topic} (search: {use_search})"
@@ -172,6 +486,35 @@ class PodcastAgent:
         if use_search:
             tools.append(types.Tool(google_search=types.GoogleSearch()))
 
+        # Only ungrounded scripts are cached; search results should stay current.
+        # Keyed on the full prompt so template edits don't serve stale scripts
+        cache_path = self._cache_path(
+            self.script_cache_dir, self.gemini_model, prompt, ".json"
+        )
+        use_cache = self.cache_enabled and not use_search
+        if use_cache and cache_path.exists():
+            parts = self._read_script_cache(cache_path)
+            if parts is not None:
+                logger.success(f"Podcast script loaded from cache: {cache_path}")
+                return parts, {}
+
+        # Fall back to a script for a paraphrase of this topic, if enabled
+        topic_embedding = None
+        if use_cache and self.script_cache_similarity > 0:
+            similar_path = None
+            try:
+                topic_embedding = self._embed_topic(topic)
+                similar_path = self._find_similar_script(topic_embedding)
+            except Exception as e:
+                logger.warning(f"Skipping similar-topic cache lookup: {e}")
+            if similar_path is not None:
+                parts = self._read_script_cache(similar_path)
+                if parts is not None:
+                    logger.success(
+                        f"Podcast script for a similar topic loaded from cache: {similar_path}"
+                    )
+                    return parts, {}
+
         try:
             # Ensure client connection is valid
             self._ensure_client_connection()
@@ -182,7 +525,8 @@ class PodcastAgent:
             )
             logger.info(f"Prompt length: {len(prompt)} characters")
 
-            response = self.client.models.generate_content(
+            response = _with_retry(
+                self.client.models.generate_content,
                 model=self.gemini_model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
@@ -201,7 +545,7 @@ class PodcastAgent:
 
             # Debug: Check response structure
             logger.info(f"Response type: {type(response)}")
-            logger.info(f"Response attributes: {dir(response)}")
+            logger.opt(lazy=True).info("Response attributes: {}", lambda: dir(response))
 
             # Try multiple ways to extract text from response
             # Method 1: Check if response has candidates
@@ -209,17 +553,23 @@ class PodcastAgent:
                 logger.info(f"Found {len(response.candidates)} candidates")
                 candidate = response.candidates[0]
                 logger.info(f"Candidate type: {type(candidate)}")
-                logger.info(f"Candidate attributes: {dir(candidate)}")
+                logger.opt(lazy=True).info(
+                    "Candidate attributes: {}", lambda: dir(candidate)
+                )
 
                 if hasattr(candidate, "content") and candidate.content:
                     logger.info(f"Content type: {type(candidate.content)}")
-                    logger.info(f"Content attributes: {dir(candidate.content)}")
+                    logger.opt(lazy=True).info(
+                        "Content attributes: {}", lambda: dir(candidate.content)
+                    )
 
                     if hasattr(candidate.content, "parts") and candidate.content.parts:
                         logger.info(f"Found {len(candidate.content.parts)} parts")
                         part = candidate.content.parts[0]
                         logger.info(f"Part type: {type(part)}")
-                        logger.info(f"Part attributes: {dir(part)}")
+                        logger.opt(lazy=True).info(
+                            "Part attributes: {}", lambda: dir(part)
+                        )
 
                         if hasattr(part, "text"):
                             full_script = part.text
@@ -239,7 +589,7 @@ class PodcastAgent:
                 logger.info(f"Found {len(response.parts)} parts in response")
                 part = response.parts[0]
                 logger.info(f"Part type: {type(part)}")
-                logger.info(f"Part attributes: {dir(part)}")
+                logger.opt(lazy=True).info("Part attributes: {}", lambda: dir(part))
 
                 if hasattr(part, "text"):
                     full_script = part.text
@@ -280,63 +630,16 @@ class PodcastAgent:
             full_script = full_script.strip()
             logger.info(f"Successfully extracted text: {len(full_script)} characters")
 
-            # Split the script into 3 parts
-            parts = full_script.split("---PART---")
-            if len(parts) != 3:
-                # Fallback: try to split by double newlines or other separators
-                parts = [
-                    part.strip() for part in full_script.split("\n\n") if part.strip()
-                ]
-                if len(parts) < 3:
-                    # If still not 3 parts, create equal divisions
-                    words = full_script.split()
-                    words_per_part = len(words) // 3
-                    parts = [
-                        " ".join(words[:words_per_part]),
-                        " ".join(words[words_per_part : words_per_part * 2]),
-                        " ".join(words[words_per_part * 2 :]),
-                    ]
-                elif len(parts) > 3:
-                    # If more than 3 parts, combine the extras
-                    parts = [parts[0], parts[1], " ".join(parts[2:])]
-
-            # Ensure we have exactly 3 parts
-            while len(parts) < 3:
-                parts.append("")
-
-            parts = parts[:3]  # Take only first 3 parts
-            parts = [part.strip() for part in parts]
-
-            # Clean up each part - remove any markdown formatting and extra whitespace
-            cleaned_parts = []
-            for part in parts:
-                # Remove markdown formatting like **text** and *text*
-                cleaned_part = part.replace("**", "").replace("*", "")
-                # Remove extra whitespace and newlines
-                cleaned_part = " ".join(cleaned_part.split())
-                cleaned_parts.append(cleaned_part)
-
-            parts = cleaned_parts
+            parts = self._split_script_parts(full_script)
 
             # Extract grounding metadata if available
-            grounding_metadata = {}
-            if hasattr(response, "candidates") and response.candidates:
-                candidate = response.candidates[0]
-                if (
-                    hasattr(candidate, "grounding_metadata")
-                    and candidate.grounding_metadata
-                ):
-                    grounding_metadata = {
-                        "web_search_queries": getattr(
-                            candidate.grounding_metadata, "web_search_queries", []
-                        ),
-                        "grounding_chunks": getattr(
-                            candidate.grounding_metadata, "grounding_chunks", []
-                        ),
-                        "grounding_supports": getattr(
-                            candidate.grounding_metadata, "grounding_supports", []
-                        ),
-                    }
+            grounding_metadata = _extract_grounding_metadata(response)
+
+            if use_cache:
+                self._write_cache(cache_path, json.dumps(parts).encode("utf-8"))
+                self._evict_cache(cache_path.parent, self.script_cache_max_entries)
+                if topic_embedding is not None:
+                    self._topic_embeddings.append((topic_embedding, cache_path))
 
             logger.success(
                 f"Podcast script generated successfully: 3 parts, {sum(len(part) for part in parts)} total characters"
@@ -347,98 +650,438 @@ class PodcastAgent:
             logger.error(f"Failed to generate podcast script: {e}")
             raise
 
-    def generate_podcast_video(
-        self,
-        script: str,
-        image: Optional[Image.Image] = None,
-        output_filename: str = "podcast_video.mp4",
-    ) -> str:
-        """Generate a single podcast video using Veo.
+    def add_citations(self, text: str, grounding_metadata: dict) -> str:
+        """Insert inline markdown citation links after each grounded segment of text.
 
         Args:
-            script: The podcast script to base the video on.
-            image: Optional starting image for the video. If provided, will use image-to-video generation.
-            output_filename: Name of the output video file.
+            text: The raw response text the grounding metadata refers to, i.e.
+                grounding_metadata["response_text"]. Segment offsets do not line up with
+                the cleaned script parts.
+            grounding_metadata: Grounding metadata dict as returned by generate_podcast_script.
 
         Returns:
-            Path to the generated video file.
+            The text with citations such as [1](https://...) inserted.
+        """
+        supports = grounding_metadata.get("grounding_supports") or []
+        chunks = grounding_metadata.get("grounding_chunks") or []
+
+        edits = []
+        for support in supports:
+            end_index = getattr(getattr(support, "segment", None), "end_index", None)
+            chunk_indices = getattr(support, "grounding_chunk_indices", None)
+            if end_index is None or not chunk_indices:
+                continue
+
+            links = [
+                f"[{i + 1}]({chunks[i].web.uri})"
+                for i in chunk_indices
+                if i < len(chunks)
+                and getattr(chunks[i], "web", None)
+                and chunks[i].web.uri
+            ]
+            if links:
+                edits.append((end_index, ", ".join(links)))
+
+        # Segment offsets are UTF-8 byte offsets, so splice in one pass over the bytes
+        encoded = text.encode("utf-8")
+        edits.sort()
+        fragments = []
+        previous = 0
+        for end_index, citation in edits:
+            fragments.append(encoded[previous:end_index])
+            fragments.append(citation.encode("utf-8"))
+            previous = end_index
+        fragments.append(encoded[previous:])
+        return b"".join(fragments).decode("utf-8", errors="replace")
+
+    def generate_podcast_scripts(self, topics: list[str]) -> list[list[str]]:
+        """Generate 3-part podcast scripts for several topics in a single Gemini call.
+
+        Args:
+            topics: The topics for the podcast episodes.
+
+        Returns:
+            List of 3-part scripts, in the same order as topics.
         """
-        # Create a detailed prompt that incorporates the script
         prompt = (
-            f"A professional podcast recording session with Alex (male host, 30s) and Sarah (female host, 30s) "
-            f"in a modern studio setting. The hosts are engaged in conversation about the following content: {script}. "
-            f"Show natural gestures, professional lighting, microphones, and recording equipment. "
-            f"Cinematic quality, smooth camera movement, realistic expressions and movements. "
-            f"Both hosts should look engaged and natural while speaking their lines. "
-            f"Create this video in square aspect ratio (1:1) format."
+            f"For each topic in the JSON list below, follow these instructions using that topic. "
+            f'Return a JSON object {{"scripts": [...]}} containing one complete script string per topic, '
+            f"in the same order as the list.\n\n"
+            f"Instructions:\n{self._build_script_prompt('the given topic')}\n\n"
+            f"Topics: {json.dumps(topics)}"
         )
 
+        logger.info(f"Generating 3-part podcast scripts for {len(topics)} topics")
+
+        try:
+            self._ensure_client_connection()
+
+            response = _with_retry(
+                self.client.models.generate_content,
+                model=self.gemini_model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.7,
+                    max_output_tokens=600 * len(topics),
+                    response_mime_type="application/json",
+                    response_schema={
+                        "type": "object",
+                        "properties": {
+                            "scripts": {"type": "array", "items": {"type": "string"}}
+                        },
+                        "required": ["scripts"],
+                    },
+                ),
+            )
+
+            scripts = json.loads(response.text)["scripts"]
+            if len(scripts) != len(topics):
+                raise Exception(
+                    f"Gemini API returned {len(scripts)} scripts for {len(topics)} topics"
+                )
+
+            all_parts = [self._split_script_parts(script.strip()) for script in scripts]
+
+            logger.success(
+                f"Podcast scripts generated successfully: {len(all_parts)} topics"
+            )
+            return all_parts
+
+        except Exception as e:
+            logger.error(f"Failed to generate podcast scripts: {e}")
+            raise
+
+    def generate_podcast_scripts_batch(
+        self, topics: list[str], use_search: bool = False
+    ) -> list[tuple[list[str], dict]]:
+        """Generate 3-part podcast scripts for several topics through the Gemini Batch API.
+
+        Batch jobs are billed at a lower rate but may take up to 24 hours, so this
+        is meant for bulk or overnight runs rather than interactive use.
+
+        Args:
+            topics: The topics for the podcast episodes.
+            use_search: Whether to use Google Search grounding for factual data.
+
+        Returns:
+            List of (3 script parts, grounding metadata dict) tuples, in the same order as topics.
+        """
         logger.info(
-            f"Generating podcast video with script length: {len(script)} characters"
+            f"Submitting batch script generation for {len(topics)} topics (search: {use_search})"
         )
 
+        generation_config = {"temperature": 0.7, "max_output_tokens": 600}
+        requests = []
+        for i, topic in enumerate(topics):
+            request = {
+                "contents": [
+                    {
+                        "parts": [{"text": self._build_script_prompt(topic)}],
+                        "role": "user",
+                    }
+                ],
+                "generation_config": generation_config,
+            }
+            if use_search:
+                request["tools"] = [{"google_search": {}}]
+            requests.append(json.dumps({"key": f"topic_{i}", "request": request}))
+
         try:
-            # Generate video with or without starting image
-            if image:
-                # Convert PIL Image to bytes for the API
-                img_bytes = BytesIO()
-                image.save(img_bytes, format="PNG")
-                img_bytes.seek(0)
-
-                operation = self.client.models.generate_videos(
-                    model=self.veo_model,
-                    prompt=prompt,
-                    image=types.Image(
-                        image_bytes=img_bytes.getvalue(), mime_type="image/png"
-                    ),
-                )
-                logger.info("Generating video with starting image")
-            else:
-                operation = self.client.models.generate_videos(
-                    model=self.veo_model,
-                    prompt=prompt,
-                )
-                logger.info("Generating video from text prompt only")
+            self._ensure_client_connection()
 
-            # Poll the operation status until the video is ready
-            logger.info("Waiting for video generation to complete...")
-            while not operation.done:
-                logger.info("Video generation in progress...")
-                time.sleep(10)
-                operation = self.client.operations.get(operation)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                jsonl_path = Path(tmp_dir) / "podcast_scripts.jsonl"
+                jsonl_path.write_text("\n".join(requests), encoding="utf-8")
+                uploaded = _with_retry(
+                    self.client.files.upload,
+                    file=jsonl_path,
+                    config={"mime_type": "jsonl"},
+                )
 
-            # Check if the operation was successful
-            if not operation.done:
-                raise Exception("Video generation operation did not complete")
+            batch_job = _with_retry(
+                self.client.batches.create,
+                idempotent=False,
+                model=self.gemini_model,
+                src=uploaded.name,
+                config={"display_name": "podcast-scripts"},
+            )
+            logger.info(f"Batch job created: {batch_job.name}")
 
-            logger.info(f"Operation completed. Response: {operation.response}")
+            # Batch jobs run for minutes to hours, so poll slowly
+            delay = 10.0
+            while batch_job.state.name not in _BATCH_DONE_STATES:
+                time.sleep(delay + random.uniform(0, 0.5 * delay))
+                batch_job = _with_retry(self.client.batches.get, name=batch_job.name)
+                logger.info(f"Batch job state: {batch_job.state.name}")
+                delay = min(delay * 1.5, 300.0)
 
-            if not operation.response:
+            if batch_job.state.name != "JOB_STATE_SUCCEEDED":
                 raise Exception(
-                    "Video generation operation completed but no response received"
+                    f"Batch job {batch_job.name} ended in state {batch_job.state.name}: {batch_job.error}"
                 )
 
-            if not hasattr(operation.response, "generated_videos"):
-                raise Exception(
-                    f"Video generation response missing 'generated_videos' attribute. Response: {operation.response}"
+            results_file = self.client.files.download(file=batch_job.dest.file_name)
+
+            results = {}
+            for line in results_file.decode("utf-8").splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                if "error" in result:
+                    raise Exception(
+                        f"Batch request {result.get('key')} failed: {result['error']}"
+                    )
+                response = types.GenerateContentResponse.model_validate(
+                    result["response"]
                 )
+                if not response.text or not response.text.strip():
+                    raise Exception(
+                        f"Gemini API returned empty text content for {result.get('key')}"
+                    )
 
-            if not operation.response.generated_videos:
-                raise Exception(
-                    "Video generation operation completed but no videos were generated"
+                results[result["key"]] = (
+                    self._split_script_parts(response.text.strip()),
+                    _extract_grounding_metadata(response),
                 )
 
-            logger.info(
-                f"Found {len(operation.response.generated_videos)} generated videos"
+            logger.success(
+                f"Batch podcast scripts generated successfully: {len(results)} topics"
+            )
+            return [results[f"topic_{i}"] for i in range(len(topics))]
+
+        except Exception as e:
+            logger.error(f"Failed to generate podcast scripts in batch: {e}")
+            raise
+
+    def _prepare_seed_image(self, image: Union[Image.Image, bytes]) -> bytes:
+        """Downscale an image to Veo's generation size and encode it as JPEG."""
+        if isinstance(image, bytes):
+            image = Image.open(BytesIO(image))
+        seed = image.convert("RGB")
+        if seed.width > 1280 or seed.height > 720:
+            seed.thumbnail((1280, 720), Image.Resampling.LANCZOS)
+        seed_bytes = BytesIO()
+        seed.save(seed_bytes, format="JPEG", quality=95)
+        return seed_bytes.getvalue()
+
+    def _image_mime_type(self, image_bytes: bytes) -> str:
+        """Return the MIME type of PNG or JPEG encoded image bytes."""
+        return "image/png" if image_bytes.startswith(b"\x89PNG") else "image/jpeg"
+
+    def _poll_operations(
+        self,
+        operations: list[types.GenerateVideosOperation],
+        on_done: Optional[Callable[[int, types.GenerateVideosOperation], None]] = None,
+    ) -> list[types.GenerateVideosOperation]:
+        """Poll Veo operations together until all are done, backing off between passes.
+
+        on_done, if given, is called with (index, operation) as soon as each
+        operation finishes, so callers can start downloading it while the
+        others are still running.
+        """
+        logger.info("Waiting for video generation to complete...")
+        operations = list(operations)
+        deadline = (
+            time.monotonic() + self.veo_poll_timeout
+            if self.veo_poll_timeout is not None
+            else None
+        )
+        delay = self.veo_poll_initial
+        reported = set()
+        while True:
+            if on_done is not None:
+                for i, operation in enumerate(operations):
+                    if operation.done and i not in reported:
+                        reported.add(i)
+                        on_done(i, operation)
+            if all(operation.done for operation in operations):
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                # Operation records are left in place so resume_episode can pick them up
+                raise TimeoutError(
+                    f"Video generation did not complete within {self.veo_poll_timeout:.0f} seconds"
+                )
+            logger.debug("Video generation in progress...")
+            time.sleep(delay + random.uniform(0, 0.5 * delay))
+            operations = [
+                (
+                    operation
+                    if operation.done
+                    else _with_retry(self.client.operations.get, operation)
+                )
+                for operation in operations
+            ]
+            delay = min(delay * 1.5, self.veo_poll_max)
+        return operations
+
+    def _save_video(
+        self, operation: types.GenerateVideosOperation, output_path: Path
+    ) -> str:
+        """Download the video of a completed Veo operation and clear its operation record."""
+        # Check if the operation was successful
+        if not operation.done:
+            raise Exception("Video generation operation did not complete")
+
+        if operation.error:
+            raise VideoGenerationError(
+                f"Video generation operation failed: {operation.error}"
+            )
+
+        logger.opt(lazy=True).info(
+            "Operation completed. Response: {}", lambda: operation.response
+        )
+
+        if not operation.response:
+            raise VideoGenerationError(
+                "Video generation operation completed but no response received"
+            )
+
+        if not hasattr(operation.response, "generated_videos"):
+            raise VideoGenerationError(
+                f"Video generation response missing 'generated_videos' attribute. Response: {operation.response}"
+            )
+
+        if not operation.response.generated_videos:
+            raise VideoGenerationError(
+                "Video generation operation completed but no videos were generated"
+            )
+
+        logger.info(
+            f"Found {len(operation.response.generated_videos)} generated videos"
+        )
+
+        # Download the generated video straight to the output file
+        generated_video = operation.response.generated_videos[0]
+        output_path.write_bytes(self.client.files.download(file=generated_video.video))
+        output_path.with_suffix(".veo_op.json").unlink(missing_ok=True)
+        return str(output_path)
+
+    def _video_models(self, quality: str) -> list[str]:
+        """Return the Veo models to try, in order, for a quality tier."""
+        if quality == "fast" or self.veo_model_fast == self.veo_model:
+            return [self.veo_model_fast]
+        # Standard quality falls back to the cheaper fast tier on failure
+        return [self.veo_model, self.veo_model_fast]
+
+    def _submit_video(
+        self,
+        script: str,
+        output_path: Path,
+        image_bytes: Optional[bytes] = None,
+        model: Optional[str] = None,
+    ) -> types.GenerateVideosOperation:
+        """Submit a Veo job for a script part without waiting for it to finish."""
+        model = model or self.veo_model
+        # Create a detailed prompt that incorporates the script
+        prompt = (
+            f"A professional podcast recording session with Alex (male host, 30s) and Sarah (female host, 30s) "
+            f"in a modern studio setting. The hosts are engaged in conversation about the following content: {script}. "
+            f"Show natural gestures, professional lighting, microphones, and recording equipment. "
+            f"Cinematic quality, smooth camera movement, realistic expressions and movements. "
+            f"Both hosts should look engaged and natural while speaking their lines. "
+            f"Create this video in square aspect ratio (1:1) format."
+        )
+
+        # The operation record is written next to the video; make sure it can be
+        # before paying for the job, or its handle would be lost
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Generate video with or without starting image
+        if image_bytes:
+            operation = _with_retry(
+                self.client.models.generate_videos,
+                idempotent=False,
+                model=model,
+                prompt=prompt,
+                image=types.Image(
+                    image_bytes=image_bytes,
+                    mime_type=self._image_mime_type(image_bytes),
+                ),
+            )
+            logger.info("Generating video with starting image")
+        else:
+            operation = _with_retry(
+                self.client.models.generate_videos,
+                idempotent=False,
+                model=model,
+                prompt=prompt,
             )
+            logger.info("Generating video from text prompt only")
+
+        # Record the operation so an interrupted run can resume it
+        op_path = output_path.with_suffix(".veo_op.json")
+        op_path.write_text(
+            json.dumps(
+                {
+                    "name": operation.name,
+                    "prompt": prompt,
+                    "model": model,
+                    "output_filename": str(output_path),
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        return operation
 
-            # Download the generated video
-            generated_video = operation.response.generated_videos[0]
-            self.client.files.download(file=generated_video.video)
+    def _await_video(
+        self, operation: types.GenerateVideosOperation, output_path: Path
+    ) -> str:
+        """Wait for a submitted Veo job, download its video and clear its operation record."""
+        (operation,) = self._poll_operations([operation])
+        return self._save_video(operation, output_path)
+
+    def generate_podcast_video(
+        self,
+        script: str,
+        image: Optional[Union[Image.Image, bytes]] = None,
+        output_filename: str = "podcast_video.mp4",
+        image_bytes: Optional[bytes] = None,
+        quality: Literal["standard", "fast"] = "standard",
+    ) -> str:
+        """Generate a single podcast video using Veo.
+
+        Args:
+            script: The podcast script to base the video on.
+            image: Optional starting image for the video, as a PIL image or encoded (PNG or JPEG) bytes.
+                If provided, will use image-to-video generation.
+            output_filename: Name of the output video file.
+            image_bytes: Optional encoded (PNG or JPEG) starting image. Takes precedence over image and is sent as-is.
+            quality: "standard" uses the main Veo model and retries with the fast model on failure;
+                "fast" uses only the fast model.
+
+        Returns:
+            Path to the generated video file.
+        """
+        logger.info(
+            f"Generating podcast video with script length: {len(script)} characters"
+        )
+
+        try:
+            if image_bytes is None and image:
+                image_bytes = (
+                    image
+                    if isinstance(image, bytes)
+                    else self._prepare_seed_image(image)
+                )
 
-            # Save to specified filename
             output_path = Path(output_filename)
-            generated_video.video.save(str(output_path))
+            models = self._video_models(quality)
+            for attempt, model in enumerate(models, 1):
+                try:
+                    operation = self._submit_video(
+                        script, output_path, image_bytes, model
+                    )
+                    self._await_video(operation, output_path)
+                    break
+                except (errors.ServerError, VideoGenerationError) as e:
+                    # Only remote generation failures are worth a new paid job;
+                    # invalid requests, local I/O errors and poll timeouts propagate
+                    if attempt == len(models):
+                        raise
+                    logger.warning(
+                        f"Video generation with {model} failed: {e}. Retrying with {models[attempt]}"
+                    )
 
             logger.success(f"Podcast video generated and saved to: {output_path}")
             return str(output_path)
@@ -450,40 +1093,138 @@ class PodcastAgent:
     def generate_multiple_podcast_videos(
         self,
         script_parts: list[str],
-        image: Optional[Image.Image] = None,
+        image: Optional[Union[Image.Image, bytes]] = None,
         output_dir: str = "output",
+        image_bytes: Optional[bytes] = None,
+        quality: Literal["standard", "fast"] = "standard",
+        on_segment_done: Optional[Callable[[int], None]] = None,
     ) -> list[str]:
         """Generate multiple podcast videos from script parts.
 
         Args:
             script_parts: List of script parts for each video segment.
-            image: Optional starting image for the videos.
+            image: Optional starting image for the videos, as a PIL image or encoded (PNG or JPEG) bytes.
             output_dir: Directory to save the video files.
+            image_bytes: Optional encoded (PNG or JPEG) starting image. Takes precedence over image.
+            quality: "standard" uses the main Veo model and regenerates failed segments with the
+                fast model; "fast" uses only the fast model.
+            on_segment_done: Optional callback invoked with the 1-based segment number as soon as
+                Veo finishes rendering that segment successfully. Runs in the calling thread, and
+                may repeat a segment whose download failed and was regenerated.
 
         Returns:
             List of paths to the generated video files.
         """
-        video_paths = []
         output_path = Path(output_dir)
 
-        for i, script_part in enumerate(script_parts, 1):
-            logger.info(f"Generating video segment {i}/{len(script_parts)}")
-            video_filename = output_path / f"podcast_video_part_{i}.mp4"
+        # Encode the shared starting image once rather than once per segment
+        if image_bytes is None and image:
+            image_bytes = (
+                image if isinstance(image, bytes) else self._prepare_seed_image(image)
+            )
 
+        video_filenames = [
+            output_path / f"podcast_video_part_{i}.mp4"
+            for i in range(1, len(script_parts) + 1)
+        ]
+
+        # Clear leftovers so a file on disk means the segment succeeded in this run
+        for video_filename in video_filenames:
+            video_filename.unlink(missing_ok=True)
+
+        models = self._video_models(quality)
+        for attempt, model in enumerate(models, 1):
+            pending = [
+                i
+                for i, video_filename in enumerate(video_filenames)
+                if not video_filename.exists()
+            ]
             try:
-                video_path = self.generate_podcast_video(
-                    script=script_part, image=image, output_filename=str(video_filename)
+                # Veo jobs are long-running remote operations: submit every segment up
+                # front, then poll them together so wall time is the slowest segment
+                with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                    logger.info(f"Submitting {len(pending)} video segments to {model}")
+                    submissions = [
+                        executor.submit(
+                            self._submit_video,
+                            script_parts[i],
+                            video_filenames[i],
+                            image_bytes,
+                            model,
+                        )
+                        for i in pending
+                    ]
+                    operations = [submission.result() for submission in submissions]
+
+                self._download_videos(
+                    operations,
+                    [video_filenames[i] for i in pending],
+                    on_done=(
+                        (lambda j: on_segment_done(pending[j] + 1))
+                        if on_segment_done
+                        else None
+                    ),
                 )
-                video_paths.append(video_path)
-                logger.success(f"Video segment {i} completed: {video_path}")
-            except Exception as e:
-                logger.error(f"Failed to generate video segment {i}: {e}")
-                raise
+                break
+            except (errors.ServerError, VideoGenerationError) as e:
+                # Only remote generation failures are worth new paid jobs; invalid
+                # requests, local I/O errors and poll timeouts propagate
+                if attempt == len(models):
+                    raise
+                logger.warning(
+                    f"Video generation with {model} failed: {e}. Regenerating failed segments with {models[attempt]}"
+                )
+
+        return [str(video_filename) for video_filename in video_filenames]
+
+    def _download_videos(
+        self,
+        operations: list[types.GenerateVideosOperation],
+        video_filenames: list[Path],
+        on_done: Optional[Callable[[int], None]] = None,
+    ) -> list[str]:
+        """Wait for Veo operations and download their videos concurrently, preserving order.
+
+        on_done, if given, is called in the calling thread with the index of each
+        operation as it finishes rendering a video; operations that fail are skipped.
+        """
+        video_paths = []
+        with ThreadPoolExecutor(max_workers=min(len(operations), 6)) as executor:
+            # Download each segment as soon as it finishes, while the rest are polled
+            downloads = [None] * len(operations)
+
+            def start_download(index: int, operation: types.GenerateVideosOperation):
+                downloads[index] = executor.submit(
+                    self._save_video, operation, video_filenames[index]
+                )
+                # Failed operations are reported by _save_video, not as rendered
+                rendered = (
+                    not operation.error
+                    and operation.response
+                    and operation.response.generated_videos
+                )
+                if on_done is not None and rendered:
+                    on_done(index)
+
+            self._poll_operations(operations, on_done=start_download)
+
+            for i, download in enumerate(downloads, 1):
+                try:
+                    video_path = download.result()
+                    video_paths.append(video_path)
+                    logger.success(f"Video segment {i} completed: {video_path}")
+                except Exception as e:
+                    logger.error(f"Failed to generate video segment {i}: {e}")
+                    raise
 
         return video_paths
 
     def combine_videos(self, video_paths: list[str], output_filename: str) -> str:
-        """Combine multiple video files into one using moviepy.
+        """Combine multiple video files into one using ffmpeg.
+
+        The segments all come from Veo with identical codec parameters, so they
+        are joined with the concat demuxer as a stream copy; a re-encode is only
+        used if the copy fails.
 
         Args:
             video_paths: List of paths to video files to combine.
@@ -492,61 +1233,133 @@ class PodcastAgent:
         Returns:
             Path to the combined video file.
         """
-        try:
-            from moviepy import VideoFileClip, concatenate_videoclips
+        ffmpeg = _ffmpeg_exe()
+        if not ffmpeg:
+            logger.error("ffmpeg is required for video combining")
+            raise Exception(
+                "ffmpeg is required for video combining. Please install it and make sure it is on PATH"
+            )
 
+        try:
             logger.info(f"Combining {len(video_paths)} videos into one")
 
-            # Load video clips
-            clips = []
+            existing_paths = []
             for video_path in video_paths:
                 if os.path.exists(video_path):
-                    clip = VideoFileClip(video_path)
-                    clips.append(clip)
-                    logger.info(f"Loaded video: {video_path}")
+                    existing_paths.append(video_path)
                 else:
                     logger.warning(f"Video file not found: {video_path}")
 
-            if not clips:
+            if not existing_paths:
                 raise Exception("No valid video clips found to combine")
 
-            # Concatenate videos
-            final_clip = concatenate_videoclips(clips)
-
-            # Write the combined video
-            final_clip.write_videofile(
-                output_filename,
-                codec="libx264",
-                audio_codec="aac",
-                temp_audiofile="temp-audio.m4a",
-                remove_temp=True,
+            # Concat demuxer input: one quoted absolute path per line
+            concat_list = Path(output_filename).with_suffix(".concat.txt")
+            concat_list.write_text(
+                "".join(
+                    "file '{}'\n".format(
+                        str(Path(video_path).resolve()).replace("'", "'\\''")
+                    )
+                    for video_path in existing_paths
+                ),
+                encoding="utf-8",
             )
 
-            # Close clips to free memory
-            for clip in clips:
-                clip.close()
-            final_clip.close()
+            command = [
+                ffmpeg,
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                str(concat_list),
+            ]
+            # Put the index at the front so playback can start before the file is fully loaded
+            faststart = ["-movflags", "+faststart"]
+            try:
+                result = subprocess.run(
+                    command + ["-c", "copy", *faststart, output_filename],
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode != 0:
+                    # Codec or timebase mismatch between segments
+                    logger.warning(
+                        f"Stream copy failed, re-encoding instead: {result.stderr.strip()}"
+                    )
+                    subprocess.run(
+                        command
+                        + [
+                            "-c:v",
+                            "libx264",
+                            "-preset",
+                            "ultrafast",
+                            "-threads",
+                            "0",
+                            "-c:a",
+                            "aac",
+                            *faststart,
+                            output_filename,
+                        ],
+                        check=True,
+                        capture_output=True,
+                        text=True,
+                    )
+            finally:
+                concat_list.unlink(missing_ok=True)
 
             logger.success(f"Videos combined successfully: {output_filename}")
             return output_filename
 
-        except ImportError:
-            logger.error(
-                "moviepy is required for video combining. Install with: pip install moviepy"
-            )
-            raise Exception(
-                "moviepy is required for video combining. Please install it with: pip install moviepy"
-            )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to combine videos: {e.stderr.strip()}")
+            raise
         except Exception as e:
             logger.error(f"Failed to combine videos: {e}")
             raise
 
+    def _remove_video_part(self, video_path: str):
+        """Delete an intermediate video file, logging rather than raising on failure."""
+        try:
+            os.remove(video_path)
+            logger.info(f"Cleaned up: {video_path}")
+        except Exception as e:
+            logger.warning(f"Could not clean up {video_path}: {e}")
+
+    def resume_episode(self, subfolder: str) -> list[str]:
+        """Resume Veo operations left pending in an episode folder by an interrupted run.
+
+        Args:
+            subfolder: Episode folder containing *.veo_op.json operation records.
+
+        Returns:
+            List of paths to the downloaded video files.
+        """
+        operations = []
+        video_filenames = []
+        for op_path in sorted(Path(subfolder).glob("*.veo_op.json")):
+            record = json.loads(op_path.read_text(encoding="utf-8"))
+            logger.info(f"Resuming Veo operation {record['name']}")
+
+            operations.append(types.GenerateVideosOperation(name=record["name"]))
+            video_filenames.append(Path(record["output_filename"]))
+
+        if not operations:
+            return []
+        return self._download_videos(operations, video_filenames)
+
     def create_podcast_episode(
         self,
         topic: str,
         output_dir: str = "tmp",
         custom_image_prompt: Optional[str] = None,
         use_search: bool = False,
+        image: Optional[Image.Image] = None,
+        image_bytes: Optional[bytes] = None,
+        script_parts: Optional[list[str]] = None,
     ) -> dict:
         """Create a complete podcast episode with image, script, and 3 combined videos.
 
@@ -555,6 +1368,10 @@ class PodcastAgent:
             output_dir: Directory to save output files.
             custom_image_prompt: Optional custom prompt for image generation.
             use_search: Whether to use Google Search grounding for factual data.
+            image: Optional pre-generated podcast image. If provided, image generation is skipped.
+            image_bytes: Optional PNG encoding of image, written to disk as-is. May be given without
+                image, in which case it is only decoded to build the Veo starting frame.
+            script_parts: Optional pre-generated 3-part script. If provided, script generation is skipped.
 
         Returns:
             Dictionary containing paths to generated files and metadata.
@@ -563,45 +1380,97 @@ class PodcastAgent:
 
         # Create timestamped subfolder with unique ID
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]  # First 8 characters of UUID
-        subfolder_name = f"{timestamp}_{unique_id}"
-
-        output_path = Path(output_dir) / subfolder_name
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Process id plus the low 32 bits of the monotonic clock. The clock can tick
+        # coarsely (~15.6 ms on Windows), so a clash with a concurrent episode in this
+        # process is retried instead of silently sharing its folder
+        while True:
+            unique_id = f"{os.getpid()}_{time.monotonic_ns() & 0xFFFFFFFF:08x}"
+            subfolder_name = f"{timestamp}_{unique_id}"
+            output_path = Path(output_dir) / subfolder_name
+            try:
+                output_path.mkdir(parents=True)
+                break
+            except FileExistsError:
+                time.sleep(0.001)
 
         try:
-            # Step 1: Generate podcast image
-            logger.info("Step 1/5: Generating podcast image...")
-            image = self.generate_podcast_image(custom_image_prompt)
-            image_path = output_path / "podcast_image.png"
-            image.save(image_path)
+            # Steps 1 and 2 are independent API calls, so run them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 1: Generate podcast image
+                logger.info("Step 1/5: Generating podcast image...")
+                if image is None and image_bytes is None:
+                    image_future = executor.submit(
+                        self.generate_podcast_image, custom_image_prompt
+                    )
+                else:
+                    logger.info("Using provided podcast image")
+                    image_future = None
+
+                # Step 2: Generate podcast script (3 parts)
+                logger.info("Step 2/5: Generating 3-part podcast script...")
+                if script_parts is None:
+                    script_future = executor.submit(
+                        self.generate_podcast_script, topic, use_search
+                    )
+                else:
+                    logger.info("Using provided podcast script")
+                    script_future = None
 
-            # Step 2: Generate podcast script (3 parts)
-            logger.info("Step 2/5: Generating 3-part podcast script...")
-            script_parts, grounding_metadata = self.generate_podcast_script(
-                topic, use_search
-            )
+                if image_future is not None:
+                    image, image_bytes = image_future.result()
+                if script_future is not None:
+                    script_parts, grounding_metadata = script_future.result()
+                else:
+                    grounding_metadata = {}
+
+            # Disk writes run in the background while the videos are generated
+            write_futures = []
+
+            # Reuse the PNG bytes from Imagen instead of re-encoding the image;
+            # otherwise the PNG encode runs in the background with the other writes
+            image_path = output_path / "podcast_image.png"
+            if image_bytes is None:
+                image.load()
+                write_futures.append(self._io_pool.submit(image.save, image_path))
+            else:
+                write_futures.append(
+                    self._io_pool.submit(image_path.write_bytes, image_bytes)
+                )
 
             # Save individual script parts
             script_paths = []
             for i, script_part in enumerate(script_parts, 1):
                 script_part_path = output_path / f"podcast_script_part_{i}.txt"
-                with open(script_part_path, "w", encoding="utf-8") as f:
-                    f.write(script_part)
+                write_futures.append(
+                    self._io_pool.submit(
+                        script_part_path.write_text, script_part, encoding="utf-8"
+                    )
+                )
                 script_paths.append(str(script_part_path))
 
             # Save combined script
             combined_script = "\n\n---PART---\n\n".join(script_parts)
             script_path = output_path / "podcast_script.txt"
-            with open(script_path, "w", encoding="utf-8") as f:
-                f.write(combined_script)
+            write_futures.append(
+                self._io_pool.submit(
+                    script_path.write_text, combined_script, encoding="utf-8"
+                )
+            )
 
             # Step 3: Generate 3 individual videos
             logger.info("Step 3/5: Generating 3 individual podcast videos...")
             video_paths = self.generate_multiple_podcast_videos(
-                script_parts=script_parts, image=image, output_dir=str(output_path)
+                script_parts=script_parts,
+                output_dir=str(output_path),
+                image_bytes=self._prepare_seed_image(
+                    image if image is not None else image_bytes
+                ),
             )
 
+            # Surface any error from the background writes
+            for write_future in write_futures:
+                write_future.result()
+
             # Step 4: Combine videos into one final video
             logger.info("Step 4/5: Combining videos into final 24-second video...")
             final_video_path = output_path / "podcast_video.mp4"
@@ -611,12 +1480,7 @@ class PodcastAgent:
 
             # Step 5: Clean up individual video parts (optional)
             logger.info("Step 5/5: Cleaning up individual video parts...")
-            for video_path in video_paths:
-                try:
-                    os.remove(video_path)
-                    logger.info(f"Cleaned up: {video_path}")
-                except Exception as e:
-                    logger.warning(f"Could not clean up {video_path}: {e}")
+            list(self._io_pool.map(self._remove_video_part, video_paths))
 
             result = {
                 "topic": topic,
@@ -639,9 +1503,87 @@ class PodcastAgent:
             logger.error(f"Failed to create podcast episode: {e}")
             raise
 
+    async def acreate_podcast_episode(
+        self,
+        topic: str,
+        output_dir: str = "tmp",
+        custom_image_prompt: Optional[str] = None,
+        use_search: bool = False,
+    ) -> dict:
+        """Create a complete podcast episode without blocking the running event loop.
+
+        The pipeline is already parallel internally, so it runs as a whole in a
+        worker thread and the loop stays free to serve other work while Veo renders.
+
+        Args:
+            topic: The topic for the podcast episode.
+            output_dir: Directory to save output files.
+            custom_image_prompt: Optional custom prompt for image generation.
+            use_search: Whether to use Google Search grounding for factual data.
+
+        Returns:
+            Dictionary containing paths to generated files and metadata.
+        """
+        return await asyncio.to_thread(
+            self.create_podcast_episode,
+            topic,
+            output_dir=output_dir,
+            custom_image_prompt=custom_image_prompt,
+            use_search=use_search,
+        )
+
+    def create_podcast_episodes(
+        self,
+        topics: list[str],
+        output_dir: str = "tmp",
+        custom_image_prompt: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> list[dict]:
+        """Create several podcast episodes, sharing one image and one script-generation call.
+
+        Args:
+            topics: The topics for the podcast episodes.
+            output_dir: Directory to save output files.
+            custom_image_prompt: Optional custom prompt for image generation.
+            max_concurrency: Maximum episodes generated at once. Defaults to VEO_MAX_CONCURRENCY.
+
+        Returns:
+            List of result dictionaries, in the same order as topics.
+        """
+        logger.info(f"Creating {len(topics)} podcast episodes")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            image_future = executor.submit(
+                self.generate_podcast_image, custom_image_prompt
+            )
+            scripts_future = executor.submit(self.generate_podcast_scripts, topics)
+            image, image_bytes = image_future.result()
+            all_script_parts = scripts_future.result()
+
+        # Video generation is wait-bound on Veo, so episodes run concurrently,
+        # capped to stay within the provider's concurrency limits
+        max_workers = min(len(topics), max_concurrency or self.veo_max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.create_podcast_episode,
+                    topic,
+                    output_dir=output_dir,
+                    image=image,
+                    image_bytes=image_bytes,
+                    script_parts=script_parts,
+                )
+                for topic, script_parts in zip(topics, all_script_parts)
+            ]
+            results = [future.result() for future in futures]
+
+        logger.success(f"Created {len(results)} podcast episodes")
+        return results
+
 
 def main():
     """Example usage of the PodcastAgent."""
+    configure_logging()
     try:
         # Initialize the agent
         agent = PodcastAgent()
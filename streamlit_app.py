@@ -1,10 +1,16 @@
 import streamlit as st
 import os
+import shutil
+import tempfile
+import threading
 import time
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from io import BytesIO
 from pathlib import Path
-from main import PodcastAgent
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from main import PodcastAgent, configure_logging
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,8 +25,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown(
-    """
+_CUSTOM_CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -49,21 +54,45 @@ st.markdown(
         padding: 1rem;
         margin: 1rem 0;
     }
-    .error-box {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .loading-spinner {
-        text-align: center;
-        padding: 2rem;
-    }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+# Veo part files only live until they are concatenated. Set PODCASTLAB_SCRATCH_DIR=/dev/shm
+# to keep them in RAM; it is opt-in because Docker's default /dev/shm is only 64 MB
+_SCRATCH_ROOT = os.getenv("PODCASTLAB_SCRATCH_DIR") or None
+
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🎙️ PodcastLab</h1>
+    <p>AI-powered podcast creator using Google's Imagen, Gemini, and Veo models</p>
+</div>
+"""
+
+# Style-only st.html is injected without adding an element to the page
+st.html(_CUSTOM_CSS)
+
+
+def _fast_rmtree(path: str) -> tuple[int, int]:
+    """Delete a directory tree in one bottom-up scandir pass, without following symlinks.
+
+    Returns:
+        Tuple of (number of files deleted, bytes freed).
+    """
+    deleted_files = 0
+    freed_space = 0
+    with os.scandir(path) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            files, size = _fast_rmtree(entry.path)
+            deleted_files += files
+            freed_space += size
+        else:
+            freed_space += entry.stat(follow_symlinks=False).st_size
+            os.unlink(entry.path)
+            deleted_files += 1
+    os.rmdir(path)
+    return deleted_files, freed_space
 
 
 def cleanup_old_files(output_dir: str = "tmp", max_age_hours: int = 24) -> dict:
@@ -77,47 +106,42 @@ def cleanup_old_files(output_dir: str = "tmp", max_age_hours: int = 24) -> dict:
     Returns:
         Dictionary with cleanup statistics
     """
-    output_path = Path(output_dir)
-    if not output_path.exists():
+    if not os.path.isdir(output_dir):
         return {"deleted_files": 0, "deleted_dirs": 0, "freed_space": 0}
 
-    cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+    cutoff_ts = time.time() - max_age_hours * 3600
     deleted_files = 0
     deleted_dirs = 0
     freed_space = 0
 
     try:
         # Get all subdirectories in output folder
-        for item in output_path.iterdir():
-            if item.is_dir():
-                # Check if directory is older than cutoff time
-                dir_creation_time = datetime.fromtimestamp(item.stat().st_ctime)
-
-                if dir_creation_time < cutoff_time:
-                    # Calculate space before deletion
-                    dir_size = sum(
-                        f.stat().st_size for f in item.rglob("*") if f.is_file()
-                    )
-                    freed_space += dir_size
-
-                    # Delete the entire directory and its contents
-                    import shutil
-
-                    shutil.rmtree(item)
-                    deleted_dirs += 1
-
-                    # Count files in the deleted directory
-                    deleted_files += sum(1 for f in item.rglob("*") if f.is_file())
+        with os.scandir(output_dir) as it:
+            entries = list(it)
+        for item in entries:
+            if not item.is_dir(follow_symlinks=False):
+                continue
+
+            # Skip young directories before descending into them
+            if item.stat(follow_symlinks=False).st_ctime >= cutoff_ts:
+                continue
+
+            # Delete the entire directory, sizing and counting files as they go
+            files, size = _fast_rmtree(item.path)
+            deleted_files += files
+            freed_space += size
+            deleted_dirs += 1
 
         return {
             "deleted_files": deleted_files,
             "deleted_dirs": deleted_dirs,
             "freed_space": freed_space,
-            "cutoff_time": cutoff_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "cutoff_time": datetime.fromtimestamp(cutoff_ts).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
         }
 
     except Exception as e:
-        st.error(f"Error during cleanup: {e}")
         return {
             "deleted_files": 0,
             "deleted_dirs": 0,
@@ -126,42 +150,121 @@ def cleanup_old_files(output_dir: str = "tmp", max_age_hours: int = 24) -> dict:
         }
 
 
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _background_cleanup(max_age_hours: int = 24) -> Future:
+    """Start cleanup_old_files in a daemon thread at most once an hour, shared by every session.
+
+    The returned future holds the cleanup statistics once the thread finishes; reading
+    it does not consume them, so every session can report the same result.
+    """
+    results = Future()
+    threading.Thread(
+        target=lambda: results.set_result(
+            cleanup_old_files(max_age_hours=max_age_hours)
+        ),
+        daemon=True,
+    ).start()
+    return results
+
+
+@st.cache_resource(show_spinner=False)
+def _configure_logging():
+    """Set up the log sink once per process rather than on every rerun."""
+    configure_logging()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_agent(api_key: str) -> PodcastAgent:
+    """Return a PodcastAgent shared by every session and rerun using the same API key."""
+    return PodcastAgent(api_key=api_key)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_podcast_image(
+    _agent: PodcastAgent, imagen_model: str, prompt_version: str = "v1"
+):
+    """Return the default studio image; it does not depend on the topic.
+
+    The agent is not hashed, so the model name is part of the key. Bump prompt_version
+    when the default image prompt changes.
+    """
+    return _agent.generate_podcast_image()
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _cached_script(_agent: PodcastAgent, topic: str, gemini_model: str):
+    """Return the ungrounded 3-part script for a topic, reused when it is generated again.
+
+    The agent is not hashed, so the model name is part of the key.
+    """
+    return _agent.generate_podcast_script(topic, use_search=False)
+
+
+class _ThrottledStatus:
+    """Forward label updates to an st.status box at most once per min_dt seconds.
+
+    A label dropped by the throttle is kept as pending until flush() or a forced update.
+    """
+
+    def __init__(self, status, min_dt: float = 0.25):
+        self.status = status
+        self.min_dt = min_dt
+        self.last = 0.0
+        self.pending = None
+
+    def update(self, label: str, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self.last < self.min_dt:
+            self.pending = label
+            return
+        self.status.update(label=label)
+        self.last = now
+        self.pending = None
+
+    def flush(self):
+        if self.pending is not None:
+            self.update(self.pending, force=True)
+
+
+def _preview_jpeg(image, max_size: int = 768) -> bytes:
+    """Encode a downscaled JPEG of image for on-page display."""
+    preview = image.convert("RGB")
+    preview.thumbnail((max_size, max_size))
+    buffer = BytesIO()
+    preview.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
 def format_file_size(size_bytes: int) -> str:
     """Convert bytes to human readable format."""
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    size_names = ("B", "KB", "MB", "GB")
+    # Each unit is 2**10 times the previous, so the bit length picks the unit
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
 
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {size_names[i]}"
 
 
 def main():
+    _configure_logging()
+
     # Header
-    st.markdown(
-        """
-    <div class="main-header">
-        <h1>🎙️ PodcastLab</h1>
-        <p>AI-powered podcast creator using Google's Imagen, Gemini, and Veo models</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
-    # Auto-cleanup on app start (only run once per session)
-    if "cleanup_done" not in st.session_state:
-        with st.spinner("🧹 Cleaning up old files (24+ hours)..."):
-            cleanup_stats = cleanup_old_files()
-            st.session_state.cleanup_done = True
-
-            if cleanup_stats["deleted_files"] > 0:
-                st.success(
-                    f"✅ Cleanup completed! Deleted {cleanup_stats['deleted_files']} files from {cleanup_stats['deleted_dirs']} directories, freed {format_file_size(cleanup_stats['freed_space'])}"
-                )
+    st.html(_HEADER_HTML)
+
+    # Auto-cleanup runs in the background; report its result once it has finished
+    cleanup_results = _background_cleanup()
+    if "cleanup_done" not in st.session_state and cleanup_results.done():
+        cleanup_stats = cleanup_results.result()
+        st.session_state.cleanup_done = True
+
+        if "error" in cleanup_stats:
+            st.error(f"Error during cleanup: {cleanup_stats['error']}")
+        elif cleanup_stats["deleted_files"] > 0:
+            st.success(
+                f"✅ Cleanup completed! Deleted {cleanup_stats['deleted_files']} files from {cleanup_stats['deleted_dirs']} directories, freed {format_file_size(cleanup_stats['freed_space'])}"
+            )
 
     # Sidebar for configuration
     with st.sidebar:
@@ -209,6 +312,13 @@ def main():
         """
         )
 
+        if os.getenv("PODCASTLAB_DEBUG"):
+            st.markdown("---")
+            st.markdown("### 🛠️ Debug")
+            if st.button("🧹 Clear cached cleanup result"):
+                _background_cleanup.clear()
+                st.session_state.pop("cleanup_done", None)
+
     # Main content area
     col1, col2 = st.columns([2, 1])
 
@@ -237,22 +347,17 @@ def main():
         if generate_button and topic.strip():
             # Initialize the agent
             try:
-                agent = PodcastAgent(api_key=api_key)
+                agent = _get_agent(api_key)
 
-                # Create progress containers
-                progress_container = st.container()
-                status_container = st.container()
+                # Create progress and result containers
+                st.markdown("### 🚀 Generation Progress")
+                status = st.status(
+                    "🖼️📝 Steps 1-2/5: Generating podcast image and 3-part script...",
+                    expanded=False,
+                )
                 result_container = st.container()
-
-                with progress_container:
-                    st.markdown("### 🚀 Generation Progress")
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-
-                # Step 1: Generate image
-                with status_container:
-                    status_text.text("🖼️ Step 1/5: Generating podcast image...")
-                    progress_bar.progress(10)
+                # Filled last, but shown above the early image/script preview
+                summary_slot = result_container.empty()
 
                 try:
                     # Create timestamped subfolder with unique ID
@@ -261,102 +366,43 @@ def main():
                     subfolder_name = f"{timestamp}_{unique_id}"
 
                     output_dir = Path("tmp") / subfolder_name
-                    output_dir.mkdir(parents=True, exist_ok=True)
-
-                    image = agent.generate_podcast_image()
-                    progress_bar.progress(20)
-
-                    # Step 2: Generate script (3 parts)
-                    status_text.text("📝 Step 2/5: Generating 3-part podcast script...")
-                    progress_bar.progress(30)
-
-                    # Refresh client connection before script generation (Streamlit fix)
-                    agent.refresh_client()
-
-                    script_parts, grounding_metadata = agent.generate_podcast_script(
-                        topic, use_search
-                    )
-                    progress_bar.progress(40)
-
-                    # Step 3: Generate 3 individual videos
-                    status_text.text("🎬 Step 3/5: Generating 3 individual videos...")
-                    progress_bar.progress(50)
-
-                    video_paths = agent.generate_multiple_podcast_videos(
-                        script_parts=script_parts,
-                        image=image,
-                        output_dir=str(output_dir),
-                    )
-                    progress_bar.progress(70)
-
-                    # Step 4: Combine videos
-                    status_text.text(
-                        "🔗 Step 4/5: Combining videos into final 24-second video..."
-                    )
-                    progress_bar.progress(80)
-
-                    final_video_path = output_dir / "podcast_video.mp4"
-                    combined_video_path = agent.combine_videos(
-                        video_paths=video_paths, output_filename=str(final_video_path)
-                    )
-                    progress_bar.progress(90)
-
-                    # Step 5: Clean up
-                    status_text.text(
-                        "🧹 Step 5/5: Cleaning up individual video parts..."
-                    )
-                    progress_bar.progress(95)
+                    parts_dir = None
+                    keep_parts = False
+
+                    # Steps 1 and 2 are independent API calls, so run them concurrently.
+                    # Workers get this session's context so st.cache_data works there
+                    ctx = get_script_run_ctx()
+                    with ThreadPoolExecutor(
+                        max_workers=2,
+                        initializer=add_script_run_ctx,
+                        initargs=(None, ctx),
+                    ) as executor:
+                        image_future = executor.submit(
+                            _cached_podcast_image, agent, agent.imagen_model
+                        )
 
-                    # Save image
-                    image_path = output_dir / "podcast_image.png"
-                    image.save(image_path)
+                        # Step 2: Generate script (3 parts). Search-grounded scripts are
+                        # never cached so their results stay current
+                        if use_search:
+                            script_future = executor.submit(
+                                agent.generate_podcast_script, topic, True
+                            )
+                        else:
+                            script_future = executor.submit(
+                                _cached_script, agent, topic, agent.gemini_model
+                            )
 
-                    # Save individual script parts
-                    script_part_paths = []
-                    for i, script_part in enumerate(script_parts, 1):
-                        script_part_path = output_dir / f"podcast_script_part_{i}.txt"
-                        with open(script_part_path, "w", encoding="utf-8") as f:
-                            f.write(script_part)
-                        script_part_paths.append(str(script_part_path))
+                        image, image_bytes = image_future.result()
+                        script_parts, grounding_metadata = script_future.result()
 
-                    # Save combined script
+                    # Show the image and script now; video rendering takes minutes
                     combined_script = "\n\n---PART---\n\n".join(script_parts)
-                    script_path = output_dir / "podcast_script.txt"
-                    with open(script_path, "w", encoding="utf-8") as f:
-                        f.write(combined_script)
-
-                    # Clean up individual video parts
-                    for video_path in video_paths:
-                        try:
-                            os.remove(video_path)
-                        except Exception as e:
-                            st.warning(f"Could not clean up {video_path}: {e}")
-
-                    video_path = combined_video_path
-
-                    # Complete
-                    progress_bar.progress(100)
-                    status_text.text("✅ Podcast generation completed!")
-
-                    # Display results
                     with result_container:
-                        st.markdown("### 🎉 Your Podcast Episode is Ready!")
-
-                        # Success message
-                        st.markdown(
-                            f"""
-                        <div class="success-box">
-                            <h4>✅ Successfully generated podcast episode about: <strong>{topic}</strong></h4>
-                            <p>📁 Files saved in: <code>tmp/{subfolder_name}/</code></p>
-                        </div>
-                        """,
-                            unsafe_allow_html=True,
-                        )
-
                         # Display image
                         st.markdown("#### 🖼️ Generated Image")
+                        # A small JPEG is plenty for the page; the PNG stays for download
                         st.image(
-                            image,
+                            _preview_jpeg(image),
                             caption="Generated podcast studio image",
                             use_container_width=True,
                         )
@@ -440,69 +486,169 @@ def main():
                                         if uri:
                                             st.markdown(f"{i}. [{title}]({uri})")
 
+                    # Step 3: Generate 3 individual videos
+                    status.update(
+                        label="🎬 Step 3/5: Generating 3 individual videos..."
+                    )
+
+                    # Report each segment as soon as Veo finishes rendering it.
+                    # Segments often finish in the same poll pass, so throttle these;
+                    # the step labels below always go through
+                    rendered = set()
+                    segment_status = _ThrottledStatus(status)
+
+                    def on_segment_done(segment: int):
+                        rendered.add(segment)
+                        # The final count always goes through so it is never left stale
+                        segment_status.update(
+                            label=f"🎬 Step 3/5: Generating 3 individual videos... ({len(rendered)}/{len(script_parts)} rendered)",
+                            force=len(rendered) == len(script_parts),
+                        )
+
+                    # Created only now so failed image/script calls leave nothing behind
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    parts_dir = Path(
+                        tempfile.mkdtemp(prefix="podcastlab_", dir=_SCRATCH_ROOT)
+                    )
+                    video_paths = agent.generate_multiple_podcast_videos(
+                        script_parts=script_parts,
+                        image=image,
+                        output_dir=str(parts_dir),
+                        on_segment_done=on_segment_done,
+                    )
+                    segment_status.flush()
+
+                    # Step 4: Combine videos
+                    status.update(
+                        label="🔗 Step 4/5: Combining videos into final 24-second video..."
+                    )
+
+                    final_video_path = output_dir / "podcast_video.mp4"
+                    combined_video_path = agent.combine_videos(
+                        video_paths=video_paths, output_filename=str(final_video_path)
+                    )
+
+                    # Step 5: Clean up
+                    status.update(
+                        label="🧹 Step 5/5: Cleaning up individual video parts..."
+                    )
+
+                    image_path = output_dir / "podcast_image.png"
+                    script_path = output_dir / "podcast_script.txt"
+
+                    # Save the image and scripts concurrently
+                    with ThreadPoolExecutor(max_workers=5) as executor:
+                        writes = [
+                            executor.submit(image_path.write_bytes, image_bytes),
+                            executor.submit(
+                                script_path.write_text,
+                                combined_script,
+                                encoding="utf-8",
+                            ),
+                        ]
+                        writes += [
+                            executor.submit(
+                                (
+                                    output_dir / f"podcast_script_part_{i}.txt"
+                                ).write_text,
+                                script_part,
+                                encoding="utf-8",
+                            )
+                            for i, script_part in enumerate(script_parts, 1)
+                        ]
+
+                        for write in writes:
+                            write.result()
+                    # Part videos go with their scratch directory in the finally below
+
+                    video_path = combined_video_path
+
+                    # Complete
+                    status.update(
+                        label="✅ Podcast generation completed!", state="complete"
+                    )
+
+                    # Display results
+                    with summary_slot.container():
+                        st.markdown("### 🎉 Your Podcast Episode is Ready!")
+
+                        # Success message
+                        st.markdown(
+                            f"""
+                        <div class="success-box">
+                            <h4>✅ Successfully generated podcast episode about: <strong>{topic}</strong></h4>
+                            <p>📁 Files saved in: <code>tmp/{subfolder_name}/</code></p>
+                        </div>
+                        """,
+                            unsafe_allow_html=True,
+                        )
+
+                    with result_container:
                         # Display video
                         st.markdown("#### 🎬 Generated Video")
                         if os.path.exists(video_path):
-                            st.video(video_path)
+                            # One read shared by the player and the download button
+                            video_bytes = Path(video_path).read_bytes()
+                            st.video(video_bytes, format="video/mp4")
 
                             # Download buttons
                             st.markdown("#### 📥 Download Files")
 
                             col_download1, col_download2, col_download3 = st.columns(3)
 
+                            # Image and script are still in memory; no need to re-read them.
+                            # Downloads don't rerun the app, so the results stay on screen
+                            # and the video is not read and sent again
                             with col_download1:
-                                with open(image_path, "rb") as img_file:
-                                    st.download_button(
-                                        label="📷 Download Image",
-                                        data=img_file.read(),
-                                        file_name=image_path.name,
-                                        mime="image/png",
-                                    )
+                                st.download_button(
+                                    label="📷 Download Image",
+                                    data=image_bytes,
+                                    file_name=image_path.name,
+                                    mime="image/png",
+                                    on_click="ignore",
+                                )
 
                             with col_download2:
-                                with open(script_path, "rb") as script_file:
-                                    st.download_button(
-                                        label="📄 Download Script",
-                                        data=script_file.read(),
-                                        file_name=script_path.name,
-                                        mime="text/plain",
-                                    )
+                                st.download_button(
+                                    label="📄 Download Script",
+                                    data=combined_script,
+                                    file_name=script_path.name,
+                                    mime="text/plain",
+                                    on_click="ignore",
+                                )
 
                             with col_download3:
-                                with open(video_path, "rb") as video_file:
-                                    st.download_button(
-                                        label="🎬 Download Video",
-                                        data=video_file.read(),
-                                        file_name=Path(video_path).name,
-                                        mime="video/mp4",
-                                    )
+                                st.download_button(
+                                    label="🎬 Download Video",
+                                    data=video_bytes,
+                                    file_name=Path(video_path).name,
+                                    mime="video/mp4",
+                                    on_click="ignore",
+                                )
                         else:
                             st.error(
                                 "Video file not found. Please check the generation process."
                             )
 
                 except Exception as e:
-                    st.markdown(
-                        f"""
-                    <div class="error-box">
-                        <h4>❌ Error during generation:</h4>
-                        <p>{str(e)}</p>
-                    </div>
-                    """,
-                        unsafe_allow_html=True,
-                    )
+                    # Don't leave a partial episode folder for the cleanup job
+                    shutil.rmtree(output_dir, ignore_errors=True)
+                    status.update(label="❌ Podcast generation failed", state="error")
                     st.error(f"Failed to generate podcast episode: {e}")
+                    if isinstance(e, TimeoutError) and parts_dir is not None:
+                        # The Veo jobs are still running and already paid for
+                        keep_parts = True
+                        st.info(
+                            f"Veo operation records were kept in `{parts_dir}`; "
+                            "resume them with `PodcastAgent.resume_episode`."
+                        )
+
+                finally:
+                    # Runs on success, failure and script stop (Stop button / rerun)
+                    if parts_dir is not None and not keep_parts:
+                        shutil.rmtree(parts_dir, ignore_errors=True)
 
             except Exception as e:
-                st.markdown(
-                    f"""
-                <div class="error-box">
-                    <h4>❌ Error initializing agent:</h4>
-                    <p>{str(e)}</p>
-                </div>
-                """,
-                    unsafe_allow_html=True,
-                )
                 st.error(f"Failed to initialize PodcastAgent: {e}")
 
     with col2: